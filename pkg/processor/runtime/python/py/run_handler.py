@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import json
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 import digitalhub as dh
 from digitalhub_core.context.builder import get_context
@@ -69,20 +73,21 @@ def handler_job(context, event) -> None:
     ############################
     # Initialize
     #############################
-    if isinstance(event.body, bytes):
-        body = json.loads(event.body)
-    context.logger.info(f"Received event: {body}")
+    logger = context.logger
+    body = orjson.loads(event.body)
+    logger.info(f"Received event: {body}")
 
-    context.logger.info("Starting task.")
+    logger.info("Starting task.")
     spec: dict = body["spec"]
     spec["inputs"] = context.run.spec.to_dict().get("inputs", {})
+    outputs: dict = spec.get("outputs", {})
     project: str = body["project"]
 
     ############################
     # Configure function
     ############################
     try:
-        context.logger.info("Configuring execution.")
+        logger.info("Configuring execution.")
         fnc = get_function_from_source(context.root, spec.get("source", {}))
     except Exception as e:
         msg = f"Something got wrong during function configuration. {e.args}"
@@ -93,7 +98,7 @@ def handler_job(context, event) -> None:
     # Set inputs
     #############################
     try:
-        context.logger.info("Configuring function inputs.")
+        logger.info("Configuring function inputs.")
         fnc_args = compose_inputs(
             spec.get("inputs", {}),
             spec.get("parameters", {}),
@@ -112,15 +117,15 @@ def handler_job(context, event) -> None:
     # Execute function
     ############################
     try:
-        context.logger.info("Executing run.")
+        logger.info("Executing run.")
         if hasattr(fnc, '__wrapped__'):
             results = fnc(project, **fnc_args)
         else:
             exec_result = fnc(**fnc_args)
             results = parse_outputs(exec_result,
-                                    list(spec.get("outputs", {})),
+                                    list(outputs),
                                     project)
-        context.logger.info(f"Output results: {results}")
+        logger.info(f"Output results: {results}")
     except Exception as e:
         msg = f"Something got wrong during function execution. {e.args}"
         return render_error(msg, context)
@@ -130,8 +135,8 @@ def handler_job(context, event) -> None:
     # Set run status
     ############################
     try:
-        context.logger.info("Building run status.")
-        status = build_status(results, spec.get("outputs", {}))
+        logger.info("Building run status.")
+        status = build_status(results, outputs)
     except Exception as e:
         msg = f"Something got wrong during building run status. {e.args}"
         return render_error(msg, context)
@@ -141,7 +146,7 @@ def handler_job(context, event) -> None:
     # Set status
     ############################
     try:
-        context.logger.info(f"Setting new run status: {status}")
+        logger.info(f"Setting new run status: {status}")
         context.run.refresh()
         new_status = {**status, **context.run.status.to_dict()}
         context.run._set_status(new_status)
@@ -154,7 +159,7 @@ def handler_job(context, event) -> None:
     ############################
     # End
     ############################
-    context.logger.info("Done.")
+    logger.info("Done.")
     return context.Response(body="OK",
                             headers={},
                             content_type='text/plain',
@@ -168,10 +173,14 @@ def handler_serve(context, event) -> None:
     ############################
     # Initialize
     #############################
-    context.logger.info("Starting task.")
+    logger = context.logger
+    logger.info("Starting task.")
     try:
-        context.logger.info("Configuring execution.")
-        fnc = get_function_from_source(context.root, context.run.spec.to_dict().get("source", {}))
+        logger.info("Configuring execution.")
+        fnc = getattr(context, "serve_function", None)
+        if fnc is None:
+            fnc = get_function_from_source(context.root, context.run.spec.to_dict().get("source", {}))
+            setattr(context, "serve_function", fnc)
     except Exception as e:
         msg = f"Something got wrong during function configuration. {e.args}"
         return render_error(msg, context)
@@ -180,7 +189,7 @@ def handler_serve(context, event) -> None:
     # Execute function
     ############################
     try:
-        context.logger.info("Executing run.")
+        logger.info("Executing run.")
         return fnc(context, event)
     except Exception as e:
         msg = f"Something got wrong during function execution. {e.args}"